@@ -1,9 +1,12 @@
 """Base skill class that all skills inherit from."""
 
+import contextlib
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any, Callable
 
 
@@ -83,6 +86,7 @@ class BaseSkill(ABC):
         """Initialize the skill."""
         self._tools: list[SkillTool] = []
         self._log_entries: list[dict[str, Any]] = []
+        self._tasks_dirs: dict[str, Path] = {}
 
     @property
     @abstractmethod
@@ -197,6 +201,76 @@ class BaseSkill(ABC):
         """Clear log entries."""
         self._log_entries.clear()
 
+    def _ensure_tasks_dir(self, project_root: str) -> Path:
+        """Get the project's tasks directory, creating it on first use.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            Path to the tasks directory
+
+        Raises:
+            OSError: If the directory cannot be created
+        """
+        tasks_dir = self._tasks_dirs.get(project_root)
+        if tasks_dir is None:
+            tasks_dir = Path(project_root) / "tasks"
+            tasks_dir.mkdir(parents=True, exist_ok=True)
+            self._tasks_dirs[project_root] = tasks_dir
+        return tasks_dir
+
+    def _write_tasks_file(self, project_root: str, filename: str, content: str) -> Path:
+        """Atomically write a file into the project's tasks directory.
+
+        The content is written to a temporary sibling and renamed into
+        place, so readers never see a partially written file.
+
+        Args:
+            project_root: Project root directory
+            filename: Name of the file within the tasks directory
+            content: Text content to write
+
+        Returns:
+            Path of the written file
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        data = content.encode("utf-8")
+        try:
+            return self._replace_tasks_file(project_root, filename, data)
+        except FileNotFoundError:
+            # The cached tasks directory was removed since it was created;
+            # forget it so it is created again, and retry once
+            self._tasks_dirs.pop(project_root, None)
+            return self._replace_tasks_file(project_root, filename, data)
+
+    def _replace_tasks_file(self, project_root: str, filename: str, data: bytes) -> Path:
+        """Write bytes to a temporary sibling and rename it into place.
+
+        Args:
+            project_root: Project root directory
+            filename: Name of the file within the tasks directory
+            data: Encoded content to write
+
+        Returns:
+            Path of the written file
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path = self._ensure_tasks_dir(project_root) / filename
+        tmp_path = path.with_name(f"{filename}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise
+        return path
+
     def format_output(
         self,
         content: str,
@@ -1,7 +1,7 @@
 """Implementer skill for writing code to fulfill user stories."""
 
+import contextlib
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any
 
 from .base import BaseSkill, SkillContext, SkillOutput, SkillTool, SkillToolType
@@ -22,6 +22,11 @@ class ImplementationTask:
     description: str
     files: list[str] = field(default_factory=list)
     completed: bool = False
+    _short_desc: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the truncated description used in summaries."""
+        self._short_desc = self.description[:50]
 
 
 @dataclass
@@ -203,7 +208,7 @@ When all assigned stories are complete, mark [PHASE_COMPLETE]."""
         completed = len([t for t in self._state.tasks if t.completed])
         total = len(self._state.tasks)
 
-        summary = f"""# Implementation Summary
+        parts: list[str] = [f"""# Implementation Summary
 
 ## Progress
 - Completed: {completed}/{total} stories
@@ -211,28 +216,26 @@ When all assigned stories are complete, mark [PHASE_COMPLETE]."""
 - Files modified: {len(self._state.files_modified)}
 
 ## Stories Completed
-"""
+"""]
         for task in self._state.tasks:
             status = "✓" if task.completed else "○"
-            summary += f"- [{status}] {task.story_id}: {task.description[:50]}\n"
+            parts.append(f"- [{status}] {task.story_id}: {task._short_desc}\n")
 
         if self._state.files_created:
-            summary += "\n## Files Created\n"
+            parts.append("\n## Files Created\n")
             for f in self._state.files_created:
-                summary += f"- {f}\n"
+                parts.append(f"- {f}\n")
 
         if self._state.files_modified:
-            summary += "\n## Files Modified\n"
+            parts.append("\n## Files Modified\n")
             for f in self._state.files_modified:
-                summary += f"- {f}\n"
+                parts.append(f"- {f}\n")
+
+        summary = "".join(parts)
 
         # Save summary
-        summary_path = Path(project_root) / "tasks" / "implementation-summary.md"
-        try:
-            summary_path.parent.mkdir(parents=True, exist_ok=True)
-            summary_path.write_text(summary, encoding="utf-8")
-        except OSError:
-            pass  # Non-critical
+        with contextlib.suppress(OSError):  # Non-critical
+            self._write_tasks_file(project_root, "implementation-summary.md", summary)
 
         return SkillOutput(
             success=True,
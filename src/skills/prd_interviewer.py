@@ -1,7 +1,9 @@
 """PRD Interviewer skill for gathering product requirements."""
 
-from dataclasses import dataclass, field
-from pathlib import Path
+import functools
+import re
+from dataclasses import asdict, dataclass, field
+from enum import Enum
 from typing import Any
 
 from .base import BaseSkill, SkillContext, SkillOutput
@@ -9,8 +11,25 @@ from .base import BaseSkill, SkillContext, SkillOutput
 
 MAX_ANSWER_LENGTH = 2000
 
+# Feature list separators and leading numbering (1., 1), etc.)
+_FEATURE_SPLIT = re.compile(r"[,\n]")
+_NUMBER_PREFIX = re.compile(r"^\d+[.)]*\s*")
 
-@dataclass
+# Maps single-letter option answers (either case) to option indices
+_OPTION_MAP: dict[str, int] = {
+    **{letter: i for i, letter in enumerate("ABCDE")},
+    **{letter: i for i, letter in enumerate("abcde")},
+}
+
+
+class InterviewPhase(Enum):
+    """Where the interview is in its ask/answer cycle."""
+    ASKING = "asking"
+    AWAITING_ANSWER = "awaiting_answer"
+    COMPLETE = "complete"
+
+
+@dataclass(frozen=True, slots=True)
 class InterviewQuestion:
     """A question in the PRD interview.
 
@@ -23,120 +42,158 @@ class InterviewQuestion:
     """
     id: str
     question: str
-    options: list[str] = field(default_factory=list)
+    options: tuple[str, ...] = ()
     follow_up: str = ""
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class InterviewState:
     """State of the PRD interview.
 
     Attributes:
-        current_question: Index of current question
+        current_question: Index of the question being asked or answered
         answers: Collected answers
         project_name: Name of the project
+        phase: Current interview phase
     """
     current_question: int = 0
     answers: dict[str, str] = field(default_factory=dict)
     project_name: str = ""
+    phase: InterviewPhase = InterviewPhase.ASKING
 
 
-# Interview questions for PRD discovery
-INTERVIEW_QUESTIONS: list[InterviewQuestion] = [
-    InterviewQuestion(
-        id="project_name",
-        question="What do you want to name this project? (one or two words)",
-        follow_up="Please provide a short project name (1-2 words).",
-    ),
-    InterviewQuestion(
-        id="description",
-        question=(
-            "Tell me about what you want to build. What is it and what "
-            "problem does it solve?"
+@functools.cache
+def _get_questions() -> tuple[InterviewQuestion, ...]:
+    """Get the interview questions for PRD discovery.
+
+    Built on first use so importing the skills package stays cheap.
+
+    Returns:
+        Interview questions in the order they are asked
+    """
+    return (
+        InterviewQuestion(
+            id="project_name",
+            question="What do you want to name this project? (one or two words)",
+            follow_up="Please provide a short project name (1-2 words).",
         ),
-        follow_up=(
-            "Could you be more specific? What exactly will this do? "
-            "What problem will it solve for users?"
+        InterviewQuestion(
+            id="description",
+            question=(
+                "Tell me about what you want to build. What is it and what "
+                "problem does it solve?"
+            ),
+            follow_up=(
+                "Could you be more specific? What exactly will this do? "
+                "What problem will it solve for users?"
+            ),
         ),
-    ),
-    InterviewQuestion(
-        id="problem",
-        question=(
-            "What specific problem does this solve? "
-            "What happens if this doesn't exist?"
+        InterviewQuestion(
+            id="problem",
+            question=(
+                "What specific problem does this solve? "
+                "What happens if this doesn't exist?"
+            ),
+            follow_up=(
+                "Can you describe the pain point more specifically? "
+                "What do users currently do without this solution?"
+            ),
         ),
-        follow_up=(
-            "Can you describe the pain point more specifically? "
-            "What do users currently do without this solution?"
+        InterviewQuestion(
+            id="users",
+            question=(
+                "Who exactly will use this? Be specific - is it you, customers, "
+                "employees, everyone?"
+            ),
+            options=(
+                "A. Just me / personal use",
+                "B. My team / internal use",
+                "C. Customers / external users",
+                "D. Everyone / public",
+            ),
+            follow_up="Please specify who the primary users will be.",
         ),
-    ),
-    InterviewQuestion(
-        id="users",
-        question=(
-            "Who exactly will use this? Be specific - is it you, customers, "
-            "employees, everyone?"
+        InterviewQuestion(
+            id="core_features",
+            question="If this could only do 3 things, what would they be?",
+            follow_up=(
+                "Please list exactly 3 core features. What are the most "
+                "important capabilities?"
+            ),
         ),
-        options=[
-            "A. Just me / personal use",
-            "B. My team / internal use",
-            "C. Customers / external users",
-            "D. Everyone / public",
-        ],
-        follow_up="Please specify who the primary users will be.",
-    ),
-    InterviewQuestion(
-        id="core_features",
-        question="If this could only do 3 things, what would they be?",
-        follow_up=(
-            "Please list exactly 3 core features. What are the most "
-            "important capabilities?"
+        InterviewQuestion(
+            id="success",
+            question=(
+                "How will you know this is working? What does success look like?"
+            ),
+            options=(
+                "A. I can complete a specific workflow",
+                "B. Users adopt it and give positive feedback",
+                "C. Metrics improve (speed, cost, errors)",
+                "D. Something else (please describe)",
+            ),
+            follow_up="What specific outcome would tell you this succeeded?",
         ),
-    ),
-    InterviewQuestion(
-        id="success",
-        question=(
-            "How will you know this is working? What does success look like?"
+        InterviewQuestion(
+            id="scope",
+            question="What should this explicitly NOT do? What's out of scope for now?",
+            follow_up=(
+                "It helps to know boundaries. What features or integrations "
+                "are you intentionally leaving out?"
+            ),
         ),
-        options=[
-            "A. I can complete a specific workflow",
-            "B. Users adopt it and give positive feedback",
-            "C. Metrics improve (speed, cost, errors)",
-            "D. Something else (please describe)",
-        ],
-        follow_up="What specific outcome would tell you this succeeded?",
-    ),
-    InterviewQuestion(
-        id="scope",
-        question="What should this explicitly NOT do? What's out of scope for now?",
-        follow_up=(
-            "It helps to know boundaries. What features or integrations "
-            "are you intentionally leaving out?"
+        InterviewQuestion(
+            id="platform",
+            question="What's the primary platform?",
+            options=(
+                "A. Web app",
+                "B. Mobile app",
+                "C. Desktop app",
+                "D. API/Backend only",
+                "E. CLI tool",
+            ),
         ),
-    ),
-    InterviewQuestion(
-        id="platform",
-        question="What's the primary platform?",
-        options=[
-            "A. Web app",
-            "B. Mobile app",
-            "C. Desktop app",
-            "D. API/Backend only",
-            "E. CLI tool",
-        ],
-    ),
-    InterviewQuestion(
-        id="tech_preferences",
-        question="Do you have any technology preferences or constraints?",
-        options=[
-            "A. No preferences - use what's best",
-            "B. Python",
-            "C. JavaScript/TypeScript",
-            "D. Other (please specify)",
-        ],
-        required=False,
-    ),
-]
+        InterviewQuestion(
+            id="tech_preferences",
+            question="Do you have any technology preferences or constraints?",
+            options=(
+                "A. No preferences - use what's best",
+                "B. Python",
+                "C. JavaScript/TypeScript",
+                "D. Other (please specify)",
+            ),
+            required=False,
+        ),
+    )
+
+
+def _format_question(question: InterviewQuestion) -> str:
+    """Format a question for display.
+
+    Args:
+        question: Question to format
+
+    Returns:
+        Formatted question string
+    """
+    if question.options:
+        return question.question + "\n\n   " + "\n   ".join(question.options)
+    return question.question
+
+
+_BACK_HINT = "\n\n(Type 'back' to revisit the previous question)"
+
+
+@functools.cache
+def _get_prompts() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Get formatted question strings, computed once.
+
+    Returns:
+        Tuple of (formatted questions, prompts with the 'back' hint)
+    """
+    formatted = tuple(_format_question(q) for q in _get_questions())
+    return formatted, tuple(f"{text}{_BACK_HINT}" for text in formatted)
 
 
 class PRDInterviewerSkill(BaseSkill):
@@ -150,6 +207,13 @@ class PRDInterviewerSkill(BaseSkill):
         """Initialize the PRD interviewer skill."""
         super().__init__()
         self._state = InterviewState()
+        self._questions = _get_questions()
+        self._formatted_questions, self._ask_prompts = _get_prompts()
+        self._history_len = 0
+        self._history_tail: dict[str, str] | None = None
+        self._last_user_input: str | None = None
+        self._state_version = 0
+        self._state_cache: tuple[int, dict[str, Any]] | None = None
 
     @property
     def name(self) -> str:
@@ -216,14 +280,17 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         if user_input and user_input.strip().lower() == "back":
             return self._go_back()
 
-        # Process answer if we have one
-        if user_input and self._state.current_question > 0:
+        # Process answer if one is expected
+        if self._state.phase is InterviewPhase.AWAITING_ANSWER and user_input:
             result = self._process_answer(user_input)
             if result:
                 return result
 
-        # Check if interview is complete
-        if self._state.current_question >= len(INTERVIEW_QUESTIONS):
+        # Past the last question there is nothing left to ask
+        if self._state.current_question >= len(self._questions):
+            self._set_phase(InterviewPhase.COMPLETE)
+
+        if self._state.phase is InterviewPhase.COMPLETE:
             return self._generate_prd(context)
 
         # Ask next question
@@ -238,10 +305,25 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         Returns:
             Last user input or None
         """
-        for msg in reversed(context.conversation_history):
+        history = context.conversation_history
+        seen = self._history_len
+        if seen and (len(history) < seen or history[seen - 1] is not self._history_tail):
+            # History was replaced, truncated or windowed, so the message
+            # last seen is no longer in place; rescan from scratch
+            seen = 0
+            self._last_user_input = None
+        elif seen == len(history):
+            return self._last_user_input
+
+        # Only scan messages appended since the last call
+        for msg in reversed(history[seen:]):
             if msg.get("role") == "user":
-                return msg.get("content", "")
-        return None
+                self._last_user_input = msg.get("content", "")
+                break
+
+        self._history_len = len(history)
+        self._history_tail = history[-1] if history else None
+        return self._last_user_input
 
     def _go_back(self) -> SkillOutput:
         """Go back to the previous question.
@@ -252,9 +334,10 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         if self._state.current_question > 0:
             self._state.current_question -= 1
             # Remove the answer for the question we're going back to
-            question = INTERVIEW_QUESTIONS[self._state.current_question]
+            question = self._questions[self._state.current_question]
             if question.id in self._state.answers:
                 del self._state.answers[question.id]
+            self._set_phase(InterviewPhase.ASKING)
 
         return self._ask_question()
 
@@ -269,40 +352,41 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         """
         answer = answer.strip()
 
-        # Get current question
-        question_idx = self._state.current_question - 1
-        if question_idx < 0 or question_idx >= len(INTERVIEW_QUESTIONS):
-            return None
-
-        question = INTERVIEW_QUESTIONS[question_idx]
+        question_idx = self._state.current_question
+        if not 0 <= question_idx < len(self._questions):
+            return self.create_error_output(
+                f"No interview question at index {question_idx}"
+            )
+        question = self._questions[question_idx]
 
         # Check for empty answer
         if not answer and question.required:
             return SkillOutput(
                 success=True,
                 content="Please provide an answer to continue.\n\n"
-                + self._format_question(question),
+                + self._formatted_questions[question_idx],
             )
 
         # Handle option selection (A, B, C, D, E)
-        if question.options and len(answer) == 1 and answer.upper() in "ABCDE":
-            option_idx = ord(answer.upper()) - ord("A")
-            if option_idx < len(question.options):
+        if question.options:
+            option_idx = _OPTION_MAP.get(answer)
+            if option_idx is not None and option_idx < len(question.options):
                 answer = question.options[option_idx]
 
         # Truncate long answers
-        if len(answer) > MAX_ANSWER_LENGTH:
+        original_length = len(answer)
+        if original_length > MAX_ANSWER_LENGTH:
             answer = answer[:MAX_ANSWER_LENGTH]
             self.log_action(
                 "truncated_answer",
-                {"question_id": question.id, "original_length": len(answer)},
+                {"question_id": question.id, "original_length": original_length},
             )
 
         # Check for vague answers (very short for descriptive questions)
         if len(answer) < 10 and question.id in ("description", "problem", "core_features"):
             return SkillOutput(
                 success=True,
-                content=question.follow_up + "\n\n" + self._format_question(question),
+                content=question.follow_up + "\n\n" + self._formatted_questions[question_idx],
             )
 
         # Store answer
@@ -316,51 +400,45 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
 
         # Move to next question
         self._state.current_question += 1
+        if self._state.current_question >= len(self._questions):
+            self._set_phase(InterviewPhase.COMPLETE)
+        else:
+            self._set_phase(InterviewPhase.ASKING)
 
         return None
 
+    def _set_phase(self, phase: InterviewPhase) -> None:
+        """Move the interview to a new phase.
+
+        Bumps the state version so the cached ``get_state`` result is
+        rebuilt; every phase change must go through here.
+
+        Args:
+            phase: Phase to enter
+        """
+        self._state.phase = phase
+        self._state_version += 1
+
     def _ask_question(self) -> SkillOutput:
         """Ask the current question.
 
         Returns:
             SkillOutput with the question
         """
-        if self._state.current_question >= len(INTERVIEW_QUESTIONS):
-            return SkillOutput(
-                success=True,
-                content="All questions answered. Generating PRD...",
+        question_idx = self._state.current_question
+        if not 0 <= question_idx < len(self._questions):
+            return self.create_error_output(
+                f"No interview question at index {question_idx}"
             )
-
-        question = INTERVIEW_QUESTIONS[self._state.current_question]
-        self._state.current_question += 1
-
-        content = self._format_question(question)
-        content += "\n\n(Type 'back' to revisit the previous question)"
+        question = self._questions[question_idx]
+        self._set_phase(InterviewPhase.AWAITING_ANSWER)
 
         return SkillOutput(
             success=True,
-            content=content,
+            content=self._ask_prompts[question_idx],
             metadata={"question_id": question.id},
         )
 
-    def _format_question(self, question: InterviewQuestion) -> str:
-        """Format a question for display.
-
-        Args:
-            question: Question to format
-
-        Returns:
-            Formatted question string
-        """
-        parts = [question.question]
-
-        if question.options:
-            parts.append("")
-            for option in question.options:
-                parts.append(f"   {option}")
-
-        return "\n".join(parts)
-
     def _generate_prd(self, context: SkillContext) -> SkillOutput:
         """Generate the PRD document.
 
@@ -376,10 +454,8 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         prd_content = self._build_prd_content(answers)
 
         # Save to file
-        prd_path = Path(context.project_root) / "tasks" / "prd.md"
         try:
-            prd_path.parent.mkdir(parents=True, exist_ok=True)
-            prd_path.write_text(prd_content, encoding="utf-8")
+            prd_path = self._write_tasks_file(context.project_root, "prd.md", prd_content)
         except OSError as e:
             return self.create_error_output(f"Failed to save PRD: {e}")
 
@@ -414,7 +490,10 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         # Parse core features into list
         features = self._parse_features(core_features)
 
-        content = f"""# PRD: {project_name.title()}
+        project_title = project_name.title()
+        problem_preview = f"{problem[:100]}..." if len(problem) > 100 else problem
+
+        parts: list[str] = [f"""# PRD: {project_title}
 
 ## Introduction
 
@@ -424,24 +503,26 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
 
 ## Goals
 
-- Solve the problem of: {problem[:100]}...
+- Solve the problem of: {problem_preview}
 - Target users: {users}
 - Platform: {platform}
 - Success criteria: {success}
 
 ## User Stories
 
-"""
+"""]
         # Generate user stories from features
         for i, feature in enumerate(features, 1):
-            content += f"### US-{i:03d}: {feature}\n"
-            content += f"**Description:** As a user, I want {feature.lower()}, "
-            content += "so that I can accomplish my goals.\n\n"
-            content += "**Acceptance Criteria:**\n"
-            content += f"- [ ] {feature} is implemented\n"
-            content += "- [ ] Typecheck passes\n\n"
+            parts.append(
+                f"### US-{i:03d}: {feature}\n"
+                f"**Description:** As a user, I want {feature.lower()}, "
+                "so that I can accomplish my goals.\n\n"
+                "**Acceptance Criteria:**\n"
+                f"- [ ] {feature} is implemented\n"
+                "- [ ] Typecheck passes\n\n"
+            )
 
-        content += f"""## Out of Scope
+        parts.append(f"""## Out of Scope
 
 {scope}
 
@@ -449,9 +530,9 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
 
 - Platform: {platform}
 - Technology preferences: {tech if tech else 'No specific preferences'}
-"""
+""")
 
-        return content
+        return "".join(parts)
 
     def _parse_features(self, features_str: str) -> list[str]:
         """Parse features string into list.
@@ -464,15 +545,10 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         """
         features: list[str] = []
 
-        # Try splitting by newlines, numbers, or commas
-        lines = features_str.replace(",", "\n").split("\n")
-
-        for line in lines:
-            # Clean up the line
-            line = line.strip()
-            # Remove numbering (1., 1), etc.)
-            if line and line[0].isdigit():
-                line = line.lstrip("0123456789").lstrip(".)").strip()
+        # Try splitting by newlines or commas
+        for line in _FEATURE_SPLIT.split(features_str):
+            # Clean up the line and remove numbering
+            line = _NUMBER_PREFIX.sub("", line.strip())
             if line:
                 features.append(line)
 
@@ -485,19 +561,28 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
     def reset(self) -> None:
         """Reset the interview state."""
         self._state = InterviewState()
+        self._history_len = 0
+        self._history_tail = None
+        self._last_user_input = None
+        self._state_version += 1
         self.clear_log()
 
     def get_state(self) -> dict[str, Any]:
         """Get current interview state.
 
+        The result is cached until the state next changes, so callers
+        must treat it as read-only.
+
         Returns:
             State dictionary
         """
-        return {
-            "current_question": self._state.current_question,
-            "answers": dict(self._state.answers),
-            "project_name": self._state.project_name,
-        }
+        if self._state_cache and self._state_cache[0] == self._state_version:
+            return self._state_cache[1]
+
+        state = asdict(self._state)
+        state["phase"] = self._state.phase.value
+        self._state_cache = (self._state_version, state)
+        return state
 
     def set_state(self, state: dict[str, Any]) -> None:
         """Restore interview state.
@@ -508,3 +593,11 @@ Mark [PHASE_COMPLETE] when the PRD is generated and saved."""
         self._state.current_question = state.get("current_question", 0)
         self._state.answers = dict(state.get("answers", {}))
         self._state.project_name = state.get("project_name", "")
+        if "phase" in state:
+            self._set_phase(InterviewPhase(state["phase"]))
+        elif self._state.current_question >= len(self._questions):
+            # States saved without a phase are complete once every
+            # question has been reached
+            self._set_phase(InterviewPhase.COMPLETE)
+        else:
+            self._set_phase(InterviewPhase.ASKING)
@@ -1,14 +1,14 @@
 """Refactorer skill for improving code quality."""
 
-from dataclasses import dataclass, field
-from pathlib import Path
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
 from .base import BaseSkill, SkillContext, SkillOutput, SkillTool, SkillToolType
 from ..tools import read_file, write_file, search_files, run_command, FileResult, ShellResult
 
 
-@dataclass
+@dataclass(slots=True)
 class RefactorItem:
     """A refactoring to perform.
 
@@ -24,7 +24,7 @@ class RefactorItem:
     completed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RefactorState:
     """State of refactoring.
 
@@ -33,7 +33,7 @@ class RefactorState:
         files_modified: Files modified during refactoring
     """
     items: list[RefactorItem] = field(default_factory=list)
-    files_modified: list[str] = field(default_factory=list)
+    files_modified: set[str] = field(default_factory=set)
 
 
 class RefactorerSkill(BaseSkill):
@@ -47,6 +47,10 @@ class RefactorerSkill(BaseSkill):
         """Initialize the refactorer skill."""
         super().__init__()
         self._state = RefactorState()
+        self._by_file: dict[str, list[RefactorItem]] = {}
+        self._pending: deque[RefactorItem] = deque()
+        self._state_version = 0
+        self._state_cache: tuple[int, dict[str, Any]] | None = None
         self._setup_tools()
 
     def _setup_tools(self) -> None:
@@ -138,13 +142,11 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
         if not self._state.items:
             self._load_from_review(context)
 
-        # Check if all items done
-        completed = all(i.completed for i in self._state.items)
-        if completed and self._state.items:
+        # Get next item to work on; none left means all items are done
+        next_item = self._get_next_item()
+        if next_item is None and self._state.items:
             return self._generate_summary(context.project_root)
 
-        # Get next item to work on
-        next_item = self._get_next_item()
         if next_item:
             return SkillOutput(
                 success=True,
@@ -170,17 +172,31 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
         """
         review_data = context.skill_outputs.get("reviewer", {})
         items = review_data.get("items", [])
+        if not items:
+            return
+
+        # Skip high severity - those should be fixed, not refactored
+        self._add_items([
+            RefactorItem(
+                file=item.get("file", ""),
+                category=item.get("category", "general"),
+                description=item.get("message", ""),
+            )
+            for item in items
+            if isinstance(item, dict) and item.get("severity", "low") != "high"
+        ])
+
+    def _add_items(self, items: list[RefactorItem]) -> None:
+        """Store items and index them by file and pending order.
 
+        Args:
+            items: Items to store
+        """
+        self._state.items.extend(items)
+        self._pending.extend(item for item in items if not item.completed)
         for item in items:
-            if isinstance(item, dict):
-                severity = item.get("severity", "low")
-                # Skip high severity - those should be fixed, not refactored
-                if severity != "high":
-                    self._state.items.append(RefactorItem(
-                        file=item.get("file", ""),
-                        category=item.get("category", "general"),
-                        description=item.get("message", ""),
-                    ))
+            self._by_file.setdefault(item.file, []).append(item)
+        self._state_version += 1
 
     def _get_next_item(self) -> RefactorItem | None:
         """Get the next item to refactor.
@@ -188,10 +204,10 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
         Returns:
             Next item or None
         """
-        for item in self._state.items:
-            if not item.completed:
-                return item
-        return None
+        # Items completed out of order are dropped lazily from the front
+        while self._pending and self._pending[0].completed:
+            self._pending.popleft()
+        return self._pending[0] if self._pending else None
 
     def _generate_summary(self, project_root: str) -> SkillOutput:
         """Generate refactoring summary.
@@ -205,28 +221,28 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
         completed = len([i for i in self._state.items if i.completed])
         total = len(self._state.items)
 
-        summary = f"""# Refactoring Summary
+        parts: list[str] = [f"""# Refactoring Summary
 
 ## Progress
 - Completed: {completed}/{total} items
 - Files modified: {len(self._state.files_modified)}
 
 ## Refactoring Completed
-"""
+"""]
         for item in self._state.items:
             status = "✓" if item.completed else "○"
-            summary += f"- [{status}] {item.file}: {item.description[:50]}\n"
+            parts.append(f"- [{status}] {item.file}: {item.description[:50]}\n")
 
         if self._state.files_modified:
-            summary += "\n## Files Modified\n"
-            for f in set(self._state.files_modified):
-                summary += f"- {f}\n"
+            parts.append("\n## Files Modified\n")
+            for f in self._state.files_modified:
+                parts.append(f"- {f}\n")
+
+        summary = "".join(parts)
 
         # Save summary
-        summary_path = Path(project_root) / "tasks" / "refactoring-summary.md"
         try:
-            summary_path.parent.mkdir(parents=True, exist_ok=True)
-            summary_path.write_text(summary, encoding="utf-8")
+            self._write_tasks_file(project_root, "refactoring-summary.md", summary)
         except OSError:
             pass  # Non-critical
 
@@ -249,11 +265,11 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
             category: Type of refactoring
             description: What to do
         """
-        self._state.items.append(RefactorItem(
+        self._add_items([RefactorItem(
             file=file,
             category=category,
             description=description,
-        ))
+        )])
         self.log_action("item_added", {"file": file, "category": category})
 
     def mark_complete(self, file: str) -> bool:
@@ -265,9 +281,10 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
         Returns:
             True if found and marked
         """
-        for item in self._state.items:
-            if item.file == file and not item.completed:
+        for item in self._by_file.get(file, ()):
+            if not item.completed:
                 item.completed = True
+                self._state_version += 1
                 self.log_action("item_completed", {"file": file})
                 return True
         return False
@@ -283,8 +300,8 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
         """Tool handler for writing files."""
         result = write_file(path, content, project_root)
         if result.success:
-            if path not in self._state.files_modified:
-                self._state.files_modified.append(path)
+            self._state.files_modified.add(path)
+            self._state_version += 1
             self.log_action("write_file", {"path": path})
         return result
 
@@ -309,31 +326,38 @@ When refactoring is complete and tests pass, mark [TASK_COMPLETE]."""
     def reset(self) -> None:
         """Reset refactoring state."""
         self._state = RefactorState()
+        self._by_file.clear()
+        self._pending.clear()
+        self._state_version += 1
         self.clear_log()
 
     def get_state(self) -> dict[str, Any]:
-        """Get current state."""
-        return {
-            "items": [
-                {
-                    "file": i.file,
-                    "category": i.category,
-                    "description": i.description,
-                    "completed": i.completed,
-                }
-                for i in self._state.items
-            ],
-            "files_modified": list(self._state.files_modified),
-        }
+        """Get current state.
+
+        The result is cached until the state next changes, so callers
+        must treat it as read-only.
+        """
+        if self._state_cache and self._state_cache[0] == self._state_version:
+            return self._state_cache[1]
+
+        state = asdict(self._state)
+        state["files_modified"] = sorted(self._state.files_modified)
+        self._state_cache = (self._state_version, state)
+        return state
 
     def set_state(self, state: dict[str, Any]) -> None:
         """Restore state."""
         self._state = RefactorState()
-        for item_data in state.get("items", []):
-            self._state.items.append(RefactorItem(
+        self._by_file.clear()
+        self._pending.clear()
+        self._add_items([
+            RefactorItem(
                 file=item_data.get("file", ""),
                 category=item_data.get("category", ""),
                 description=item_data.get("description", ""),
                 completed=item_data.get("completed", False),
-            ))
-        self._state.files_modified = list(state.get("files_modified", []))
+            )
+            for item_data in state.get("items", [])
+        ])
+        self._state.files_modified = set(state.get("files_modified", []))
+        self._state_version += 1
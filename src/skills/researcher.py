@@ -1,14 +1,79 @@
 """Researcher skill for investigating codebases and gathering context."""
 
+import io
+import itertools
+import os
+from collections import deque
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any
 
 from .base import BaseSkill, SkillContext, SkillOutput, SkillTool, SkillToolType
-from ..tools import read_file, list_dir, search_files, FileResult
+from ..tools import (
+    read_file,
+    read_file_head,
+    list_dir,
+    search_files,
+    walk_sources,
+    FileResult,
+)
+
+
+# Maximum number of general notes kept; the oldest are dropped first
+MAX_NOTES = 500
+
+# Findings from project descriptor files per project root, with the
+# (name, mtime, size) of each descriptor so that edits are picked up
+_EXPLORATION_CACHE: dict[str, tuple[tuple[tuple[str, int, int], ...], "ResearchFindings"]] = {}
+
+# Project descriptor files, in priority order
+_COMMON_FILES = (
+    "README.md",
+    "readme.md",
+    "package.json",
+    "requirements.txt",
+    "pyproject.toml",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+)
+
+# Source globs probed during initial exploration, in priority order
+_SOURCE_PATTERNS = ("src/**/*.py", "src/**/*.ts", "src/**/*.js", "lib/**/*.py")
+
+
+# System prompt for the LLM
+_RESEARCHER_PROMPT = """You are a Code Researcher. Your job is to explore and understand codebases.
 
+Your goals:
+1. Understand the project structure and architecture
+2. Identify key files and their purposes
+3. Document patterns and conventions used
+4. Note dependencies and integrations
+5. Gather context needed for implementation
+
+Available tools:
+- read_file(path): Read a file's contents
+- list_dir(path): List directory contents
+- search_files(pattern): Search for files matching a glob pattern
+
+Research strategy:
+1. Start by listing the root directory to understand structure
+2. Read README, package.json, requirements.txt, or similar for overview
+3. Explore src/ or main code directories
+4. Read key configuration files
+5. Document your findings as you go
 
-@dataclass
+Output your findings as structured markdown with sections:
+- Architecture Overview
+- Key Files
+- Patterns & Conventions
+- Dependencies
+- Notes for Implementation
+
+When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
+
+
+@dataclass(slots=True)
 class ResearchFindings:
     """Collected research findings.
 
@@ -17,13 +82,13 @@ class ResearchFindings:
         key_files: Important files discovered
         patterns: Code patterns found
         dependencies: Dependencies identified
-        notes: General notes
+        notes: Most recent general notes, bounded by MAX_NOTES
     """
     architecture: list[str] = field(default_factory=list)
     key_files: dict[str, str] = field(default_factory=dict)
     patterns: list[str] = field(default_factory=list)
     dependencies: list[str] = field(default_factory=list)
-    notes: list[str] = field(default_factory=list)
+    notes: deque[str] = field(default_factory=lambda: deque(maxlen=MAX_NOTES))
 
 
 class ResearcherSkill(BaseSkill):
@@ -37,6 +102,8 @@ class ResearcherSkill(BaseSkill):
         """Initialize the researcher skill."""
         super().__init__()
         self._findings = ResearchFindings()
+        self._walk_cache: dict[str, dict[str, list[str]]] = {}
+        self._explored = False
         self._setup_tools()
 
     def _setup_tools(self) -> None:
@@ -73,35 +140,7 @@ class ResearcherSkill(BaseSkill):
     @property
     def system_prompt(self) -> str:
         """Get system prompt for the LLM."""
-        return """You are a Code Researcher. Your job is to explore and understand codebases.
-
-Your goals:
-1. Understand the project structure and architecture
-2. Identify key files and their purposes
-3. Document patterns and conventions used
-4. Note dependencies and integrations
-5. Gather context needed for implementation
-
-Available tools:
-- read_file(path): Read a file's contents
-- list_dir(path): List directory contents
-- search_files(pattern): Search for files matching a glob pattern
-
-Research strategy:
-1. Start by listing the root directory to understand structure
-2. Read README, package.json, requirements.txt, or similar for overview
-3. Explore src/ or main code directories
-4. Read key configuration files
-5. Document your findings as you go
-
-Output your findings as structured markdown with sections:
-- Architecture Overview
-- Key Files
-- Patterns & Conventions
-- Dependencies
-- Notes for Implementation
-
-When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
+        return _RESEARCHER_PROMPT
 
     def execute(self, context: SkillContext) -> SkillOutput:
         """Execute the researcher skill.
@@ -147,34 +186,38 @@ When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
         root_contents = root_result.output
         self._findings.notes.append(f"Root contents:\n{root_contents}")
 
-        # Look for common project files
-        common_files = [
-            "README.md",
-            "readme.md",
-            "package.json",
-            "requirements.txt",
-            "pyproject.toml",
-            "Cargo.toml",
-            "go.mod",
-            "pom.xml",
+        # Look for common project files, only opening ones that exist
+        present = [
+            filename for filename in _COMMON_FILES
+            if filename in (root_result.entries or ())
         ]
 
-        for filename in common_files:
-            result = read_file(filename, project_root)
-            if result.success:
-                self._findings.key_files[filename] = result.output[:500]
-                self._analyze_project_file(filename, result.output)
-                break
+        # A fresh instance reuses descriptor findings while the descriptors
+        # are unchanged; later explorations always read them again
+        if self._explored:
+            found = self._read_descriptors(project_root, present)
+        else:
+            signature = self._descriptor_signature(project_root, present)
+            cached = _EXPLORATION_CACHE.get(project_root)
+            if cached and cached[0] == signature:
+                found = cached[1]
+            else:
+                found = self._read_descriptors(project_root, present)
+                if signature is not None:
+                    _EXPLORATION_CACHE[project_root] = (signature, found)
+        self._merge_findings(found)
+        self._explored = True
 
         # Search for source directories
-        for pattern in ["src/**/*.py", "src/**/*.ts", "src/**/*.js", "lib/**/*.py"]:
-            result = search_files(pattern, project_root)
-            if result.success and result.output:
-                files = result.output.split("\n")[:10]  # First 10 files
+        sources = self._walk_cache.get(project_root)
+        if sources is None:
+            sources = self._walk_cache[project_root] = self._scan_sources(project_root)
+        for pattern in _SOURCE_PATTERNS:
+            if sources.get(pattern):
+                files = sources[pattern][:10]  # First 10 files
                 self._findings.notes.append(f"Source files ({pattern}): {len(files)} found")
                 break
 
-        # Build initial report
         content = self._build_exploration_summary()
         content += "\n\nContinue exploring with read_file() and list_dir() tools."
         content += "\nMark [PHASE_COMPLETE] when you have enough context."
@@ -185,28 +228,111 @@ When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
             metadata={"exploration": "initial"},
         )
 
-    def _analyze_project_file(self, filename: str, content: str) -> None:
+    def _descriptor_signature(
+        self,
+        project_root: str,
+        present: list[str],
+    ) -> tuple[tuple[str, int, int], ...] | None:
+        """Identify the current contents of the project's descriptor files.
+
+        Args:
+            project_root: Project root directory
+            present: Descriptor files present in the root
+
+        Returns:
+            (name, mtime, size) for each descriptor, or None if one could
+            not be stat-ed
+        """
+        signature = []
+        for filename in present:
+            try:
+                st = os.stat(os.path.join(project_root, filename))
+            except OSError:
+                return None
+            signature.append((filename, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def _read_descriptors(self, project_root: str, present: list[str]) -> ResearchFindings:
+        """Read the first readable descriptor file and analyze it.
+
+        Args:
+            project_root: Project root directory
+            present: Descriptor files present in the root, in priority order
+
+        Returns:
+            Findings from the descriptor; must not be mutated once cached
+        """
+        found = ResearchFindings()
+        for filename in present:
+            # Descriptors are only sniffed, so read just their head
+            if filename.lower() == "readme.md":
+                result = read_file(filename, project_root)
+            else:
+                result = read_file_head(filename, project_root)
+            if result.success:
+                found.key_files[filename] = result.output[:500]
+                self._analyze_project_file(filename, result.output, found)
+                break
+        return found
+
+    def _merge_findings(self, found: ResearchFindings) -> None:
+        """Add findings to the ones gathered so far.
+
+        Args:
+            found: Findings to add; left unchanged
+        """
+        self._findings.architecture.extend(found.architecture)
+        self._findings.key_files.update(found.key_files)
+        self._findings.patterns.extend(found.patterns)
+        self._findings.dependencies.extend(found.dependencies)
+        self._findings.notes.extend(found.notes)
+
+    def _scan_sources(self, project_root: str) -> dict[str, list[str]]:
+        """Collect source files for all probed patterns in one walk.
+
+        Args:
+            project_root: Root directory to scan
+
+        Returns:
+            Relative file paths keyed by the pattern they match
+        """
+        sources: dict[str, list[str]] = {}
+        for top in ("src", "lib"):
+            top_path = os.path.join(project_root, top)
+            for rel_path in walk_sources(top_path, (".py", ".ts", ".js")):
+                pattern = f"{top}/**/*{os.path.splitext(rel_path)[1]}"
+                if pattern in _SOURCE_PATTERNS:
+                    sources.setdefault(pattern, []).append(os.path.join(top, rel_path))
+        return sources
+
+    def _analyze_project_file(
+        self,
+        filename: str,
+        content: str,
+        findings: ResearchFindings,
+    ) -> None:
         """Analyze a project configuration file.
 
         Args:
             filename: Name of the file
             content: File contents
+            findings: Findings to record results in
         """
         if filename == "package.json":
-            self._findings.architecture.append("Node.js/JavaScript project")
+            findings.architecture.append("Node.js/JavaScript project")
             if '"dependencies"' in content:
-                self._findings.dependencies.append("See package.json for npm dependencies")
+                findings.dependencies.append("See package.json for npm dependencies")
 
         elif filename in ("requirements.txt", "pyproject.toml"):
-            self._findings.architecture.append("Python project")
+            findings.architecture.append("Python project")
             if "pyproject.toml" in filename:
-                self._findings.patterns.append("Uses modern pyproject.toml configuration")
+                findings.patterns.append("Uses modern pyproject.toml configuration")
 
         elif filename == "Cargo.toml":
-            self._findings.architecture.append("Rust project")
+            findings.architecture.append("Rust project")
 
         elif filename == "go.mod":
-            self._findings.architecture.append("Go project")
+            findings.architecture.append("Go project")
 
     def _build_exploration_summary(self) -> str:
         """Build summary of exploration so far.
@@ -230,7 +356,7 @@ When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
 
         if self._findings.notes:
             parts.append("### Notes")
-            for note in self._findings.notes[:5]:  # First 5 notes
+            for note in itertools.islice(self._findings.notes, 5):  # First 5 notes
                 parts.append(f"- {note[:200]}")
 
         return "\n".join(parts)
@@ -247,10 +373,8 @@ When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
         report = self._build_report()
 
         # Save report
-        report_path = Path(project_root) / "tasks" / "research-findings.md"
         try:
-            report_path.parent.mkdir(parents=True, exist_ok=True)
-            report_path.write_text(report, encoding="utf-8")
+            report_path = self._write_tasks_file(project_root, "research-findings.md", report)
         except OSError as e:
             return self.create_error_output(f"Failed to save report: {e}")
 
@@ -268,49 +392,51 @@ When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
         Returns:
             Report as markdown
         """
-        parts = ["# Research Findings\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w("# Research Findings\n\n")
 
-        parts.append("## Architecture Overview\n")
+        w("## Architecture Overview\n\n")
         if self._findings.architecture:
             for item in self._findings.architecture:
-                parts.append(f"- {item}")
+                w(f"- {item}\n")
         else:
-            parts.append("- No architecture notes recorded")
-        parts.append("")
+            w("- No architecture notes recorded\n")
+        w("\n")
 
-        parts.append("## Key Files\n")
+        w("## Key Files\n\n")
         if self._findings.key_files:
             for filename, summary in self._findings.key_files.items():
-                parts.append(f"### {filename}")
-                parts.append(f"```\n{summary[:300]}...\n```\n")
+                w(f"### {filename}\n")
+                w(f"```\n{summary[:300]}...\n```\n\n")
         else:
-            parts.append("- No key files recorded")
-        parts.append("")
+            w("- No key files recorded\n")
+        w("\n")
 
-        parts.append("## Patterns & Conventions\n")
+        w("## Patterns & Conventions\n\n")
         if self._findings.patterns:
             for pattern in self._findings.patterns:
-                parts.append(f"- {pattern}")
+                w(f"- {pattern}\n")
         else:
-            parts.append("- No patterns noted")
-        parts.append("")
+            w("- No patterns noted\n")
+        w("\n")
 
-        parts.append("## Dependencies\n")
+        w("## Dependencies\n\n")
         if self._findings.dependencies:
             for dep in self._findings.dependencies:
-                parts.append(f"- {dep}")
+                w(f"- {dep}\n")
         else:
-            parts.append("- No dependencies noted")
-        parts.append("")
+            w("- No dependencies noted\n")
+        w("\n")
 
-        parts.append("## Notes for Implementation\n")
+        w("## Notes for Implementation\n\n")
         if self._findings.notes:
             for note in self._findings.notes:
-                parts.append(f"- {note[:500]}")
+                w(f"- {note[:500]}\n")
         else:
-            parts.append("- No additional notes")
+            w("- No additional notes\n")
 
-        return "\n".join(parts)
+        return buf.getvalue()
 
     def _read_file(self, path: str, project_root: str) -> FileResult:
         """Tool handler for reading files.
@@ -381,30 +507,45 @@ When you have gathered sufficient context, mark [PHASE_COMPLETE]."""
     def reset(self) -> None:
         """Reset research findings."""
         self._findings = ResearchFindings()
+        self._walk_cache.clear()
+        self._explored = False
         self.clear_log()
 
     def get_state(self) -> dict[str, Any]:
         """Get current state.
 
+        Collections are snapshotted as tuples so the result can be shared
+        safely, e.g. by the exploration cache.
+
         Returns:
             State dictionary
         """
         return {
-            "architecture": list(self._findings.architecture),
+            "architecture": tuple(self._findings.architecture),
             "key_files": dict(self._findings.key_files),
-            "patterns": list(self._findings.patterns),
-            "dependencies": list(self._findings.dependencies),
-            "notes": list(self._findings.notes),
+            "patterns": tuple(self._findings.patterns),
+            "dependencies": tuple(self._findings.dependencies),
+            "notes": tuple(self._findings.notes),
         }
 
+    def get_findings(self) -> ResearchFindings:
+        """Get the live findings without copying.
+
+        Callers must not mutate the returned object.
+
+        Returns:
+            Current research findings
+        """
+        return self._findings
+
     def set_state(self, state: dict[str, Any]) -> None:
         """Restore state.
 
         Args:
-            state: State dictionary
+            state: State dictionary; collections may be any iterable
         """
-        self._findings.architecture = list(state.get("architecture", []))
+        self._findings.architecture = list(state.get("architecture", ()))
         self._findings.key_files = dict(state.get("key_files", {}))
-        self._findings.patterns = list(state.get("patterns", []))
-        self._findings.dependencies = list(state.get("dependencies", []))
-        self._findings.notes = list(state.get("notes", []))
+        self._findings.patterns = list(state.get("patterns", ()))
+        self._findings.dependencies = list(state.get("dependencies", ()))
+        self._findings.notes = deque(state.get("notes", ()), maxlen=MAX_NOTES)
@@ -1,45 +1,185 @@
 """Reviewer skill for checking code quality and suggesting improvements."""
 
+import functools
+import importlib.util
+import io
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from pathlib import Path
+from enum import IntEnum
 from typing import Any
 
 from .base import BaseSkill, SkillContext, SkillOutput, SkillTool, SkillToolType
 from ..tools import read_file, search_files, run_command, FileResult, ShellResult
 
 
-@dataclass
+# Maximum number of review items kept; the oldest are dropped first
+MAX_REVIEW_ITEMS = 10_000
+
+# Linter diagnostics of the form file:line[:col]: message
+_LINT_LINE = re.compile(r"([^:\n]+):(\d+):(?:\d+:)?\s*(.*)")
+
+
+class Severity(IntEnum):
+    """Severity of a review item, ordered from least to most severe."""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+    @classmethod
+    def parse(
+        cls,
+        value: "str | Severity",
+        default: "Severity | None" = None,
+    ) -> "Severity":
+        """Convert a severity name (low, medium, high) to a Severity.
+
+        Args:
+            value: Severity name or member
+            default: Severity to use for unknown names
+
+        Returns:
+            Matching Severity, or default for an unknown name
+
+        Raises:
+            ValueError: If the name is unknown and no default is given
+        """
+        if isinstance(value, Severity):
+            return value
+        try:
+            return cls[value.upper()]
+        except KeyError:
+            if default is not None:
+                return default
+            raise ValueError(f"Unknown severity: {value!r}") from None
+
+
+# System prompt for the LLM
+_REVIEWER_PROMPT = """You are a Code Reviewer. Your job is to check code quality and identify issues.
+
+Review categories:
+1. **Bugs**: Potential bugs or logic errors
+2. **Security**: Security vulnerabilities (injection, XSS, etc.)
+3. **Performance**: Performance issues or inefficiencies
+4. **Style**: Code style and readability issues
+5. **Best Practices**: Violations of language/framework best practices
+
+Available tools:
+- read_file(path): Read a file's contents
+- search_files(pattern): Search for files
+- run_command(cmd): Run linters or type checkers
+
+Review process:
+1. Search for source files to review
+2. Read each file and analyze
+3. Run available linters/checkers if applicable
+4. Document issues with severity (low, medium, high)
+5. Provide specific suggestions for fixes
+
+Output format for each issue:
+```
+[SEVERITY] Category: File:Line
+Issue: Description
+Suggestion: How to fix
+```
+
+When review is complete, provide a summary with:
+- Total issues by severity
+- Overall assessment (PASS/FAIL)
+- Priority items to address
+
+Mark [PHASE_COMPLETE] when the review is done."""
+
+
+@dataclass(slots=True)
 class ReviewItem:
     """A single review item.
 
     Attributes:
         file: File path
         line: Line number (if applicable)
-        severity: low, medium, high
+        severity: Severity of the issue
         category: Type of issue
         message: Description of the issue
         suggestion: Suggested fix
     """
     file: str
     line: int | None
-    severity: str
+    severity: Severity
     category: str
     message: str
     suggestion: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewFindings:
     """Collected review findings.
 
     Attributes:
-        items: List of review items
+        items: Most recent review items, bounded by MAX_REVIEW_ITEMS
         summary: Overall summary
         passed: Whether the review passed
+        severity_counts: Number of stored items per severity
     """
-    items: list[ReviewItem] = field(default_factory=list)
+    items: deque[ReviewItem] = field(
+        default_factory=lambda: deque(maxlen=MAX_REVIEW_ITEMS)
+    )
     summary: str = ""
     passed: bool = True
+    severity_counts: dict[Severity, int] = field(
+        default_factory=lambda: dict.fromkeys(Severity, 0)
+    )
+
+
+@functools.cache
+def _have_tool(name: str) -> bool:
+    """Check whether an executable is available on PATH.
+
+    Args:
+        name: Executable name
+
+    Returns:
+        True if the executable was found
+    """
+    return shutil.which(name) is not None
+
+
+@functools.cache
+def _have_python_module(module: str) -> bool:
+    """Check whether ``python -m <module>`` can run.
+
+    Probes the ``python`` found on PATH, which is what the checks invoke;
+    when that is the current interpreter's own path the module is looked
+    up in-process.
+
+    Args:
+        module: Top-level module name
+
+    Returns:
+        True if the module is importable by the python on PATH
+    """
+    python = shutil.which("python")
+    if python is None:
+        return False
+    # Compare unresolved paths: a venv's python resolves to its base
+    # interpreter's binary but sees different site-packages
+    if os.path.abspath(python) == os.path.abspath(sys.executable):
+        return importlib.util.find_spec(module) is not None
+    try:
+        result = subprocess.run(
+            [python, "-c", f"import importlib.util, sys; "
+             f"sys.exit(importlib.util.find_spec({module!r}) is None)"],
+            capture_output=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
 
 
 class ReviewerSkill(BaseSkill):
@@ -89,40 +229,7 @@ class ReviewerSkill(BaseSkill):
     @property
     def system_prompt(self) -> str:
         """Get system prompt for the LLM."""
-        return """You are a Code Reviewer. Your job is to check code quality and identify issues.
-
-Review categories:
-1. **Bugs**: Potential bugs or logic errors
-2. **Security**: Security vulnerabilities (injection, XSS, etc.)
-3. **Performance**: Performance issues or inefficiencies
-4. **Style**: Code style and readability issues
-5. **Best Practices**: Violations of language/framework best practices
-
-Available tools:
-- read_file(path): Read a file's contents
-- search_files(pattern): Search for files
-- run_command(cmd): Run linters or type checkers
-
-Review process:
-1. Search for source files to review
-2. Read each file and analyze
-3. Run available linters/checkers if applicable
-4. Document issues with severity (low, medium, high)
-5. Provide specific suggestions for fixes
-
-Output format for each issue:
-```
-[SEVERITY] Category: File:Line
-Issue: Description
-Suggestion: How to fix
-```
-
-When review is complete, provide a summary with:
-- Total issues by severity
-- Overall assessment (PASS/FAIL)
-- Priority items to address
-
-Mark [PHASE_COMPLETE] when the review is done."""
+        return _REVIEWER_PROMPT
 
     def execute(self, context: SkillContext) -> SkillOutput:
         """Execute the reviewer skill.
@@ -152,20 +259,41 @@ Mark [PHASE_COMPLETE] when the review is done."""
         Args:
             project_root: Project root directory
         """
-        # Try running common linters/checkers
+        # Try running common linters/checkers, skipping ones not installed
         checks = [
-            ("python -m mypy . --ignore-missing-imports", "mypy"),
-            ("python -m flake8 . --max-line-length=100", "flake8"),
-            ("npm run lint 2>/dev/null || true", "eslint"),
+            (cmd, tool_name)
+            for cmd, tool_name, available in (
+                (
+                    "python -m mypy . --ignore-missing-imports",
+                    "mypy",
+                    _have_python_module("mypy"),
+                ),
+                (
+                    "python -m flake8 . --max-line-length=100",
+                    "flake8",
+                    _have_python_module("flake8"),
+                ),
+                ("npm run lint 2>/dev/null || true", "eslint", _have_tool("npm")),
+            )
+            if available
         ]
-
-        for cmd, tool_name in checks:
-            result = run_command(cmd, cwd=project_root, timeout=30)
-            if result.success or result.stdout or result.stderr:
-                output = result.stdout or result.stderr
-                if output.strip():
-                    self._parse_linter_output(tool_name, output)
-                    self.log_action("ran_check", {"tool": tool_name})
+        if not checks:
+            return
+
+        # Checks are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [
+                executor.submit(run_command, cmd, cwd=project_root, timeout=30)
+                for cmd, _ in checks
+            ]
+            results = [future.result() for future in futures]
+
+        # Record findings in check order on this thread
+        for (_, tool_name), result in zip(checks, results):
+            output = result.stdout or result.stderr
+            if output and not output.isspace():
+                self._parse_linter_output(tool_name, output)
+                self.log_action("ran_check", {"tool": tool_name})
 
     def _parse_linter_output(self, tool: str, output: str) -> None:
         """Parse linter output into review items.
@@ -174,6 +302,9 @@ Mark [PHASE_COMPLETE] when the review is done."""
             tool: Name of the linter tool
             output: Linter output
         """
+        if not output or output.isspace():
+            return
+
         lines = output.strip().split("\n")
 
         for line in lines[:20]:  # Limit to first 20 issues
@@ -181,29 +312,24 @@ Mark [PHASE_COMPLETE] when the review is done."""
                 continue
 
             # Generic parsing - extract file:line if present
-            parts = line.split(":", 3)
-            if len(parts) >= 3:
-                try:
-                    file_path = parts[0]
-                    line_num = int(parts[1])
-                    message = parts[2].strip() if len(parts) > 2 else line
-
-                    self.add_issue(
-                        file=file_path,
-                        line=line_num,
-                        severity="medium",
-                        category=tool,
-                        message=message,
-                    )
-                except (ValueError, IndexError):
-                    # Can't parse, add as generic note
-                    self._findings.items.append(ReviewItem(
-                        file="",
-                        line=None,
-                        severity="low",
-                        category=tool,
-                        message=line[:200],
-                    ))
+            match = _LINT_LINE.match(line)
+            if match:
+                self.add_issue(
+                    file=match.group(1),
+                    line=int(match.group(2)),
+                    severity="medium",
+                    category=tool,
+                    message=match.group(3).strip(),
+                )
+            elif line.count(":") >= 2:
+                # Can't parse, add as generic note
+                self._record_item(ReviewItem(
+                    file="",
+                    line=None,
+                    severity=Severity.LOW,
+                    category=tool,
+                    message=line[:200],
+                ))
 
     def _generate_report(self, project_root: str) -> SkillOutput:
         """Generate review report.
@@ -217,10 +343,8 @@ Mark [PHASE_COMPLETE] when the review is done."""
         report = self._build_report()
 
         # Save report
-        report_path = Path(project_root) / "tasks" / "review-report.md"
         try:
-            report_path.parent.mkdir(parents=True, exist_ok=True)
-            report_path.write_text(report, encoding="utf-8")
+            report_path = self._write_tasks_file(project_root, "review-report.md", report)
         except OSError as e:
             return self.create_error_output(f"Failed to save report: {e}")
 
@@ -242,50 +366,57 @@ Mark [PHASE_COMPLETE] when the review is done."""
         Returns:
             Report as markdown
         """
-        parts = ["# Code Review Report\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w("# Code Review Report\n\n")
 
         # Count by severity
-        high = len([i for i in self._findings.items if i.severity == "high"])
-        medium = len([i for i in self._findings.items if i.severity == "medium"])
-        low = len([i for i in self._findings.items if i.severity == "low"])
+        counts = self._findings.severity_counts
+        high = counts[Severity.HIGH]
+        medium = counts[Severity.MEDIUM]
+        low = counts[Severity.LOW]
 
         self._findings.passed = high == 0
 
-        parts.append("## Summary\n")
-        parts.append(f"- **High severity**: {high}")
-        parts.append(f"- **Medium severity**: {medium}")
-        parts.append(f"- **Low severity**: {low}")
-        parts.append(f"- **Status**: {'PASS' if self._findings.passed else 'FAIL'}")
-        parts.append("")
+        w("## Summary\n\n")
+        w(f"- **High severity**: {high}\n")
+        w(f"- **Medium severity**: {medium}\n")
+        w(f"- **Low severity**: {low}\n")
+        w(f"- **Status**: {'PASS' if self._findings.passed else 'FAIL'}\n")
+        w("\n")
 
         if self._findings.items:
-            parts.append("## Issues\n")
+            w("## Issues\n\n")
+
+            # Group by severity in a single pass
+            buckets: dict[Severity, list[ReviewItem]] = {sev: [] for sev in Severity}
+            for item in self._findings.items:
+                buckets[item.severity].append(item)
 
-            # Group by severity
-            for severity in ["high", "medium", "low"]:
-                items = [i for i in self._findings.items if i.severity == severity]
+            for severity in reversed(Severity):
+                items = buckets[severity]
                 if items:
-                    parts.append(f"### {severity.title()} Severity\n")
+                    w(f"### {severity.name.title()} Severity\n\n")
                     for item in items:
                         loc = f"{item.file}"
                         if item.line:
                             loc += f":{item.line}"
-                        parts.append(f"**[{item.category}]** {loc}")
-                        parts.append(f"- {item.message}")
+                        w(f"**[{item.category}]** {loc}\n")
+                        w(f"- {item.message}\n")
                         if item.suggestion:
-                            parts.append(f"- *Suggestion*: {item.suggestion}")
-                        parts.append("")
+                            w(f"- *Suggestion*: {item.suggestion}\n")
+                        w("\n")
         else:
-            parts.append("## Issues\n")
-            parts.append("No issues found.")
+            w("## Issues\n\n")
+            w("No issues found.\n")
 
-        return "\n".join(parts)
+        return buf.getvalue()
 
     def add_issue(
         self,
         file: str,
         line: int | None,
-        severity: str,
+        severity: str | Severity,
         category: str,
         message: str,
         suggestion: str = "",
@@ -295,12 +426,14 @@ Mark [PHASE_COMPLETE] when the review is done."""
         Args:
             file: File path
             line: Line number
-            severity: low, medium, high
+            severity: Severity, or its name (low, medium, high); unknown
+                names are recorded as low
             category: Issue category
             message: Issue description
             suggestion: Suggested fix
         """
-        self._findings.items.append(ReviewItem(
+        severity = Severity.parse(severity, default=Severity.LOW)
+        self._record_item(ReviewItem(
             file=file,
             line=line,
             severity=severity,
@@ -309,15 +442,29 @@ Mark [PHASE_COMPLETE] when the review is done."""
             suggestion=suggestion,
         ))
 
-        if severity == "high":
+        if severity is Severity.HIGH:
             self._findings.passed = False
 
         self.log_action("issue_added", {
             "file": file,
-            "severity": severity,
+            "severity": severity.name.lower(),
             "category": category,
         })
 
+    def _record_item(self, item: ReviewItem) -> None:
+        """Store a review item and keep severity counts in sync.
+
+        Args:
+            item: Item to store
+        """
+        items = self._findings.items
+        counts = self._findings.severity_counts
+        if len(items) == items.maxlen:
+            # The deque is about to drop its oldest item
+            counts[items[0].severity] -= 1
+        items.append(item)
+        counts[item.severity] += 1
+
     def _read_file(self, path: str, project_root: str) -> FileResult:
         """Tool handler for reading files."""
         result = read_file(path, project_root)
@@ -355,7 +502,7 @@ Mark [PHASE_COMPLETE] when the review is done."""
                 {
                     "file": i.file,
                     "line": i.line,
-                    "severity": i.severity,
+                    "severity": i.severity.name.lower(),
                     "category": i.category,
                     "message": i.message,
                     "suggestion": i.suggestion,
@@ -369,10 +516,12 @@ Mark [PHASE_COMPLETE] when the review is done."""
         """Restore state."""
         self._findings = ReviewFindings()
         for item_data in state.get("items", []):
-            self._findings.items.append(ReviewItem(
+            self._record_item(ReviewItem(
                 file=item_data.get("file", ""),
                 line=item_data.get("line"),
-                severity=item_data.get("severity", "low"),
+                severity=Severity.parse(
+                    item_data.get("severity", "low"), default=Severity.LOW
+                ),
                 category=item_data.get("category", ""),
                 message=item_data.get("message", ""),
                 suggestion=item_data.get("suggestion", ""),
@@ -2,10 +2,16 @@
 
 from .file_ops import (
     FileResult,
+    ProjectContext,
     read_file,
+    read_file_head,
+    read_files,
     write_file,
+    write_files,
+    copy_file,
     list_dir,
     search_files,
+    walk_sources,
 )
 from .shell import (
     ShellResult,
@@ -14,10 +20,16 @@ from .shell import (
 
 __all__ = [
     "FileResult",
+    "ProjectContext",
     "read_file",
+    "read_file_head",
+    "read_files",
     "write_file",
+    "write_files",
+    "copy_file",
     "list_dir",
     "search_files",
+    "walk_sources",
     "ShellResult",
     "run_command",
 ]
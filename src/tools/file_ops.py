@@ -1,10 +1,16 @@
 """File operation tools for reading and writing files."""
 
 import fnmatch
+import functools
+import operator
 import os
+import re
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 
 @dataclass
@@ -16,11 +22,52 @@ class FileResult:
         output: The output content (for read operations)
         error: Error message if operation failed
         metadata: Additional metadata about the operation
+        entries: Directory entry names (for list operations), with a
+            trailing slash on directories
     """
     success: bool
     output: str = ""
     error: str = ""
     metadata: dict[str, Any] | None = None
+    entries: tuple[str, ...] | None = None
+
+
+# Buffer size for whole-file reads and writes, well above the 8KB default
+_BUFFER_SIZE = 128 * 1024
+
+# Lets read_file open a FIFO without blocking so it can be rejected; it has
+# no effect on regular files
+_O_NONBLOCK = getattr(os, "O_NONBLOCK", 0)
+
+# Number of leading bytes checked for null bytes to detect binary files
+BINARY_SAMPLE_SIZE = 1024
+
+# Magic numbers of common binary formats that may lack null bytes early on
+BINARY_SIGNATURES: tuple[bytes, ...] = (
+    b"\x7fELF",  # ELF executable
+    b"\x89PNG\r\n\x1a\n",  # PNG image
+    b"\xff\xd8\xff",  # JPEG image
+    b"GIF87a",  # GIF image
+    b"GIF89a",
+    b"%PDF-",  # PDF document
+    b"PK\x03\x04",  # ZIP archive
+    b"\x1f\x8b",  # gzip archive
+)
+
+# Lookup table indexed by byte value: non-zero for bytes that start a
+# signature, so most files are cleared with a single index
+_SIGNATURE_LEADS = bytes(
+    1 if any(sig[0] == b for sig in BINARY_SIGNATURES) else 0 for b in range(256)
+)
+
+# Sort key for directory entries
+_get_name = operator.attrgetter("name")
+
+# Default number of worker threads for batch file operations
+BATCH_MAX_WORKERS = 8
+
+# Directories that walk_sources never descends into
+PRUNE_DIRS = frozenset({".git", "node_modules", ".venv", "__pycache__", "dist", "build"})
 
 
 class FileOperationError(Exception):
@@ -33,7 +80,76 @@ class PathTraversalError(FileOperationError):
     pass
 
 
-def _validate_path(path: Path, project_root: Path) -> Path:
+@dataclass(frozen=True, slots=True)
+class ProjectContext:
+    """A project root resolved once for repeated file operations.
+
+    Can be passed as ``project_root`` to any file operation in place of a
+    path, so that long-running callers skip root resolution entirely.
+
+    Attributes:
+        root: Resolved absolute project root
+        root_sep: The root with a trailing separator, for prefix checks
+    """
+    root: str
+    root_sep: str
+
+    @classmethod
+    def of(cls, project_root: str | Path) -> "ProjectContext":
+        """Resolve a project root.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            ProjectContext for the resolved root
+        """
+        root = os.path.realpath(project_root)
+        return cls(root, root if root.endswith(os.sep) else root + os.sep)
+
+    def __fspath__(self) -> str:
+        """Get the resolved root, so the context works as a path."""
+        return self.root
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(path_str: str) -> ProjectContext:
+    """Resolve a project root, caching the result.
+
+    Only project roots go through this cache: they are stable across
+    calls, whereas target paths may be replaced by symlinks at any time
+    and must be resolved afresh on every validation.
+
+    Args:
+        path_str: Absolute project root
+
+    Returns:
+        ProjectContext for the resolved root
+    """
+    return ProjectContext.of(path_str)
+
+
+def _clear_resolve_cache() -> None:
+    """Forget all cached project root resolutions."""
+    _resolve_cached.cache_clear()
+
+
+def _coerce(project_root: str | Path | ProjectContext) -> ProjectContext:
+    """Get the ProjectContext for a project root.
+
+    Args:
+        project_root: Project root directory or context
+
+    Returns:
+        ProjectContext for the root
+    """
+    if isinstance(project_root, ProjectContext):
+        return project_root
+    # Key on the absolute path so a relative root follows the working directory
+    return _resolve_cached(os.path.abspath(project_root))
+
+
+def _validate_path(path: str | Path, project_root: str | Path | ProjectContext) -> Path:
     """Validate that a path doesn't escape the project root.
 
     Args:
@@ -47,42 +163,56 @@ def _validate_path(path: Path, project_root: Path) -> Path:
         PathTraversalError: If the path would escape the project root
     """
     # Resolve both paths to absolute
-    resolved_path = path.resolve()
-    resolved_root = project_root.resolve()
+    resolved_path = os.path.realpath(path)
+    context = _coerce(project_root)
 
-    # Check if the resolved path is within the project root
-    try:
-        resolved_path.relative_to(resolved_root)
-    except ValueError:
+    # Check if the resolved path is within the project root; the separator
+    # keeps a sibling such as /project-other from matching /project
+    if resolved_path != context.root and not resolved_path.startswith(context.root_sep):
         raise PathTraversalError(
             f"Path '{path}' escapes project root. "
             f"Paths containing '..' that escape the project directory are not allowed."
         )
 
-    return resolved_path
+    return Path(resolved_path)
 
 
-def _is_binary_file(file_path: Path, sample_size: int = 1024) -> bool:
-    """Check if a file is binary by looking for null bytes.
+def _is_binary(head: bytes) -> bool:
+    """Check whether the start of a file looks binary.
 
     Args:
-        file_path: Path to the file
-        sample_size: Number of bytes to check (default: 1KB)
+        head: Leading bytes of the file
 
     Returns:
-        True if the file appears to be binary
+        True if the bytes contain a null byte or start with a known
+        binary signature
     """
-    try:
-        with open(file_path, "rb") as f:
-            sample = f.read(sample_size)
-            return b"\x00" in sample
-    except OSError:
+    if b"\x00" in head:
+        return True
+    # Only compare signatures when the first byte can start one
+    if not head or not _SIGNATURE_LEADS[head[0]]:
         return False
+    return head.startswith(BINARY_SIGNATURES)
+
+
+def _stat_once(path: str | Path) -> os.stat_result | None:
+    """Stat a path, so existence and type come from a single syscall.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        The stat result, or None if the path does not exist
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def read_file(
     path: str | Path,
-    project_root: str | Path,
+    project_root: str | Path | ProjectContext,
 ) -> FileResult:
     """Read a file's contents.
 
@@ -93,53 +223,72 @@ def read_file(
     Returns:
         FileResult with the file contents or error
     """
-    file_path = Path(path)
-    root_path = Path(project_root)
-
     # Handle relative paths
-    if not file_path.is_absolute():
-        file_path = root_path / file_path
+    file_path = os.fspath(path)
+    if not os.path.isabs(file_path):
+        file_path = os.path.join(project_root, file_path)
 
     # Validate path doesn't escape project root
     try:
-        validated_path = _validate_path(file_path, root_path)
+        validated_path = _validate_path(file_path, project_root)
     except PathTraversalError as e:
         return FileResult(
             success=False,
             error=str(e),
         )
 
-    # Check file exists
-    if not validated_path.exists():
+    # Open the path directly rather than stat-ing it first; the type is
+    # checked on the open descriptor instead
+    try:
+        fd = os.open(validated_path, os.O_RDONLY | _O_NONBLOCK)
+    except (FileNotFoundError, NotADirectoryError):
         return FileResult(
             success=False,
             error=f"File not found: {path}",
         )
-
-    if not validated_path.is_file():
+    except PermissionError:
         return FileResult(
             success=False,
-            error=f"Not a file: {path}",
+            error=f"Permission denied: {path}",
         )
-
-    # Check if binary
-    if _is_binary_file(validated_path):
+    except OSError as e:
         return FileResult(
             success=False,
-            error=f"Cannot read binary file: {path}",
-            metadata={"is_binary": True},
+            error=f"Error reading file: {e}",
         )
 
-    # Read file
+    # Read file once as bytes, checking the head for binary content before
+    # reading the rest; size and line count come from the buffer
     try:
-        content = validated_path.read_text(encoding="utf-8")
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            os.close(fd)
+            return FileResult(
+                success=False,
+                error=f"Not a file: {path}",
+            )
+        with open(fd, "rb", buffering=_BUFFER_SIZE) as f:
+            head = f.read(BINARY_SAMPLE_SIZE)
+            if _is_binary(head):
+                return FileResult(
+                    success=False,
+                    error=f"Cannot read binary file: {path}",
+                    metadata={"is_binary": True},
+                )
+            data = head + f.read()
+        content = data.decode("utf-8")
+        if b"\r" in data:
+            # Match text mode, which translates \r\n and \r to \n
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+            lines = content.count("\n") + 1
+        else:
+            lines = data.count(b"\n") + 1
         return FileResult(
             success=True,
             output=content,
             metadata={
                 "path": str(validated_path),
-                "size": validated_path.stat().st_size,
-                "lines": content.count("\n") + 1,
+                "size": len(data),
+                "lines": lines,
             },
         )
     except PermissionError:
@@ -160,10 +309,88 @@ def read_file(
         )
 
 
+def read_file_head(
+    path: str | Path,
+    project_root: str | Path | ProjectContext,
+    limit: int = 4096,
+) -> FileResult:
+    """Read at most the first ``limit`` bytes of a file.
+
+    Useful when only the start of a file needs to be inspected, such
+    as a project descriptor.
+
+    Args:
+        path: Path to the file (relative or absolute)
+        project_root: Root directory for path validation
+        limit: Maximum number of bytes to read (default: 4KB)
+
+    Returns:
+        FileResult with the leading file contents or error
+    """
+    # Handle relative paths
+    file_path = os.fspath(path)
+    if not os.path.isabs(file_path):
+        file_path = os.path.join(project_root, file_path)
+
+    # Validate path doesn't escape project root
+    try:
+        validated_path = _validate_path(file_path, project_root)
+    except PathTraversalError as e:
+        return FileResult(
+            success=False,
+            error=str(e),
+        )
+
+    st = _stat_once(validated_path)
+    if st is None:
+        return FileResult(
+            success=False,
+            error=f"File not found: {path}",
+        )
+
+    if not stat.S_ISREG(st.st_mode):
+        return FileResult(
+            success=False,
+            error=f"Not a file: {path}",
+        )
+
+    try:
+        with open(validated_path, "rb") as f:
+            head = f.read(limit)
+    except PermissionError:
+        return FileResult(
+            success=False,
+            error=f"Permission denied: {path}",
+        )
+    except OSError as e:
+        return FileResult(
+            success=False,
+            error=f"Error reading file: {e}",
+        )
+
+    if _is_binary(head):
+        return FileResult(
+            success=False,
+            error=f"Cannot read binary file: {path}",
+            metadata={"is_binary": True},
+        )
+
+    # A multi-byte character may be cut at the limit, so drop partial bytes
+    return FileResult(
+        success=True,
+        output=head.decode("utf-8", errors="ignore"),
+        metadata={
+            "path": str(validated_path),
+            "bytes_read": len(head),
+        },
+    )
+
+
 def write_file(
     path: str | Path,
     content: str,
-    project_root: str | Path,
+    project_root: str | Path | ProjectContext,
+    count_lines: bool = False,
 ) -> FileResult:
     """Write content to a file.
 
@@ -173,20 +400,20 @@ def write_file(
         path: Path to the file (relative or absolute)
         content: Content to write
         project_root: Root directory for path validation
+        count_lines: Whether to include the line count in the metadata,
+            which costs a pass over the content
 
     Returns:
         FileResult indicating success or error
     """
-    file_path = Path(path)
-    root_path = Path(project_root)
-
     # Handle relative paths
-    if not file_path.is_absolute():
-        file_path = root_path / file_path
+    file_path = os.fspath(path)
+    if not os.path.isabs(file_path):
+        file_path = os.path.join(project_root, file_path)
 
     # Validate path doesn't escape project root
     try:
-        validated_path = _validate_path(file_path, root_path)
+        validated_path = _validate_path(file_path, project_root)
     except PathTraversalError as e:
         return FileResult(
             success=False,
@@ -207,17 +434,21 @@ def write_file(
             error=f"Error creating directory: {e}",
         )
 
-    # Write file
+    # Write file, encoding once; size and line count come from the bytes
+    data = content.encode("utf-8")
     try:
-        validated_path.write_text(content, encoding="utf-8")
+        with open(validated_path, "wb", buffering=_BUFFER_SIZE) as f:
+            f.write(data)
+        metadata: dict[str, Any] = {
+            "path": str(validated_path),
+            "size": len(data),
+        }
+        if count_lines:
+            metadata["lines"] = data.count(b"\n") + 1
         return FileResult(
             success=True,
-            output=f"Wrote {len(content)} bytes to {path}",
-            metadata={
-                "path": str(validated_path),
-                "size": len(content.encode("utf-8")),
-                "lines": content.count("\n") + 1,
-            },
+            output=f"Wrote {len(data)} bytes to {path}",
+            metadata=metadata,
         )
     except PermissionError:
         return FileResult(
@@ -231,9 +462,156 @@ def write_file(
         )
 
 
+def copy_file(
+    src: str | Path,
+    dst: str | Path,
+    project_root: str | Path | ProjectContext,
+) -> FileResult:
+    """Copy a file without decoding its contents.
+
+    The copy is done by the kernel where the platform supports it
+    (sendfile on Linux, fcopyfile on macOS), so content read from one
+    file and written to another never passes through Python strings.
+    Creates parent directories of the destination if they don't exist.
+
+    Args:
+        src: Path to the source file (relative or absolute)
+        dst: Path to the destination file (relative or absolute)
+        project_root: Root directory for path validation
+
+    Returns:
+        FileResult indicating success or error
+    """
+    # Handle relative paths
+    src_path = os.fspath(src)
+    if not os.path.isabs(src_path):
+        src_path = os.path.join(project_root, src_path)
+    dst_path = os.fspath(dst)
+    if not os.path.isabs(dst_path):
+        dst_path = os.path.join(project_root, dst_path)
+
+    # Validate paths don't escape project root
+    try:
+        validated_src = _validate_path(src_path, project_root)
+        validated_dst = _validate_path(dst_path, project_root)
+    except PathTraversalError as e:
+        return FileResult(
+            success=False,
+            error=str(e),
+        )
+
+    st = _stat_once(validated_src)
+    if st is None:
+        return FileResult(
+            success=False,
+            error=f"File not found: {src}",
+        )
+
+    if not stat.S_ISREG(st.st_mode):
+        return FileResult(
+            success=False,
+            error=f"Not a file: {src}",
+        )
+
+    # Create parent directories
+    try:
+        validated_dst.parent.mkdir(parents=True, exist_ok=True)
+    except PermissionError:
+        return FileResult(
+            success=False,
+            error=f"Permission denied creating directory: {validated_dst.parent}",
+        )
+    except OSError as e:
+        return FileResult(
+            success=False,
+            error=f"Error creating directory: {e}",
+        )
+
+    # Copy file
+    try:
+        shutil.copyfile(validated_src, validated_dst)
+        return FileResult(
+            success=True,
+            output=f"Copied {st.st_size} bytes from {src} to {dst}",
+            metadata={
+                "src": str(validated_src),
+                "path": str(validated_dst),
+                "size": st.st_size,
+            },
+        )
+    except PermissionError:
+        return FileResult(
+            success=False,
+            error=f"Permission denied copying {src} to {dst}",
+        )
+    except OSError as e:
+        return FileResult(
+            success=False,
+            error=f"Error copying file: {e}",
+        )
+
+
+def read_files(
+    paths: Iterable[str | Path],
+    project_root: str | Path | ProjectContext,
+    max_workers: int = BATCH_MAX_WORKERS,
+) -> list[FileResult]:
+    """Read several files concurrently.
+
+    Each file is read as by read_file, so one failure does not affect the
+    others.
+
+    Args:
+        paths: Paths to the files (relative or absolute)
+        project_root: Root directory for path validation, resolved once
+            for the whole batch
+        max_workers: Maximum number of files read at once
+
+    Returns:
+        FileResult for each path, in the order given
+    """
+    paths = list(paths)
+    project_root = _coerce(project_root)
+    if len(paths) <= 1:
+        return [read_file(path, project_root) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(lambda path: read_file(path, project_root), paths))
+
+
+def write_files(
+    items: Iterable[tuple[str | Path, str]],
+    project_root: str | Path | ProjectContext,
+    max_workers: int = BATCH_MAX_WORKERS,
+) -> list[FileResult]:
+    """Write several files concurrently.
+
+    Each file is written as by write_file, so one failure does not affect
+    the others. Paths should be distinct, as writes to the same file race.
+
+    Args:
+        items: (path, content) pairs to write
+        project_root: Root directory for path validation, resolved once
+            for the whole batch
+        max_workers: Maximum number of files written at once
+
+    Returns:
+        FileResult for each item, in the order given
+    """
+    items = list(items)
+    project_root = _coerce(project_root)
+    if len(items) <= 1:
+        return [write_file(path, content, project_root) for path, content in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(
+            lambda item: write_file(item[0], item[1], project_root), items
+        ))
+
+
 def list_dir(
     path: str | Path,
-    project_root: str | Path,
+    project_root: str | Path | ProjectContext,
     pattern: str | None = None,
 ) -> FileResult:
     """List contents of a directory.
@@ -246,45 +624,51 @@ def list_dir(
     Returns:
         FileResult with list of files/directories
     """
-    dir_path = Path(path)
-    root_path = Path(project_root)
-
     # Handle relative paths
-    if not dir_path.is_absolute():
-        dir_path = root_path / dir_path
+    dir_path = os.fspath(path)
+    if not os.path.isabs(dir_path):
+        dir_path = os.path.join(project_root, dir_path)
 
     # Validate path doesn't escape project root
     try:
-        validated_path = _validate_path(dir_path, root_path)
+        validated_path = _validate_path(dir_path, project_root)
     except PathTraversalError as e:
         return FileResult(
             success=False,
             error=str(e),
         )
 
-    if not validated_path.exists():
+    st = _stat_once(validated_path)
+    if st is None:
         return FileResult(
             success=False,
             error=f"Directory not found: {path}",
         )
 
-    if not validated_path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         return FileResult(
             success=False,
             error=f"Not a directory: {path}",
         )
 
     try:
-        entries: list[str] = []
-        for entry in sorted(validated_path.iterdir()):
-            name = entry.name
-            if pattern and not fnmatch.fnmatch(name, pattern):
-                continue
-
-            # Add trailing slash for directories
-            if entry.is_dir():
-                name += "/"
-            entries.append(name)
+        # Compile the glob once rather than looking it up per entry
+        matcher = re.compile(fnmatch.translate(pattern)).match if pattern else None
+
+        # Filter before sorting so only matching entries are sorted
+        with os.scandir(validated_path) as it:
+            if matcher:
+                dir_entries = [entry for entry in it if matcher(entry.name)]
+            else:
+                dir_entries = list(it)
+        dir_entries.sort(key=_get_name)
+
+        # Add trailing slash for directories; DirEntry answers from the
+        # directory listing and only stats symlinks
+        entries = [
+            entry.name + "/" if entry.is_dir() else entry.name
+            for entry in dir_entries
+        ]
 
         return FileResult(
             success=True,
@@ -293,6 +677,7 @@ def list_dir(
                 "path": str(validated_path),
                 "count": len(entries),
             },
+            entries=tuple(entries),
         )
     except PermissionError:
         return FileResult(
@@ -306,9 +691,91 @@ def list_dir(
         )
 
 
+def _glob_walk(search_path: str, pattern: str) -> Iterator[str]:
+    """Yield paths under a directory that match a glob pattern.
+
+    Follows Path.glob semantics: ``**`` matches any number of directories
+    but does not recurse into symlinked directories, named and wildcard
+    components do follow symlinks, and a trailing ``**`` or slash matches
+    directories only. Each directory carries the pattern components it
+    can still match, so subtrees that cannot contain a match are never
+    read.
+
+    Args:
+        search_path: Directory to search
+        pattern: Glob pattern relative to search_path
+
+    Yields:
+        Matching paths relative to search_path
+    """
+    parts = [part for part in pattern.split("/") if part not in ("", ".")]
+    if not parts:
+        return
+
+    # None marks a "**" component
+    matchers = [
+        None if part == "**" else re.compile(fnmatch.translate(part)).match
+        for part in parts
+    ]
+    final = len(parts)
+    dirs_only = parts[-1] == "**" or pattern.endswith("/")
+
+    def closure(states: set[int]) -> frozenset[int]:
+        # "**" may match zero components, so it also allows the next state
+        pending = list(states)
+        while pending:
+            i = pending.pop()
+            if i < final and matchers[i] is None and i + 1 not in states:
+                states.add(i + 1)
+                pending.append(i + 1)
+        return frozenset(states)
+
+    def advance(states: frozenset[int], name: str, recurse: bool) -> frozenset[int]:
+        following: set[int] = set()
+        for i in states:
+            if i == final:
+                continue
+            matcher = matchers[i]
+            if matcher is None:
+                if recurse:
+                    following.add(i)
+            elif matcher(name):
+                following.add(i + 1)
+        return closure(following)
+
+    start = closure({0})
+    if final in start:
+        # A pattern of only "**" matches the search directory itself
+        yield ""
+
+    pending: list[tuple[str, str, frozenset[int]]] = [(search_path, "", start)]
+    while pending:
+        dir_path, prefix, states = pending.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            # "**" only recurses into real directories, so a symlinked
+            # directory is reachable through named or wildcard components
+            child_states = advance(
+                states, entry.name, recurse=not (is_dir and entry.is_symlink())
+            )
+            if final in child_states and (is_dir or not dirs_only):
+                yield prefix + entry.name
+            if is_dir and any(i < final for i in child_states):
+                pending.append((entry.path, prefix + entry.name + os.sep, child_states))
+
+
 def search_files(
     pattern: str,
-    project_root: str | Path,
+    project_root: str | Path | ProjectContext,
     path: str | Path | None = None,
 ) -> FileResult:
     """Search for files matching a pattern.
@@ -325,28 +792,29 @@ def search_files(
     search_path = root_path
 
     if path:
-        search_path = Path(path)
-        if not search_path.is_absolute():
-            search_path = root_path / search_path
+        search_str = os.fspath(path)
+        if not os.path.isabs(search_str):
+            search_str = os.path.join(project_root, search_str)
 
         # Validate path doesn't escape project root
         try:
-            search_path = _validate_path(search_path, root_path)
+            search_path = _validate_path(search_str, project_root)
         except PathTraversalError as e:
             return FileResult(
                 success=False,
                 error=str(e),
             )
 
-    if not search_path.exists():
+    if _stat_once(search_path) is None:
         return FileResult(
             success=False,
-            error=f"Search path not found: {path or project_root}",
+            error=f"Search path not found: {path or os.fspath(project_root)}",
         )
 
     try:
         matches: list[str] = []
-        for match in search_path.glob(pattern):
+        for rel in _glob_walk(str(search_path), pattern):
+            match = search_path / rel
             # Get relative path from project root
             try:
                 rel_path = match.relative_to(root_path)
@@ -375,3 +843,41 @@ def search_files(
             success=False,
             error=f"Error searching files: {e}",
         )
+
+
+def walk_sources(
+    root: str | Path,
+    extensions: tuple[str, ...],
+    limit: int | None = None,
+    prune: frozenset[str] = PRUNE_DIRS,
+) -> Iterator[str]:
+    """Yield files with the given extensions under a directory.
+
+    Hidden directories and those named in ``prune`` are skipped without
+    being read, and symlinked directories are not followed.
+
+    Args:
+        root: Directory to walk
+        extensions: File name suffixes to match (e.g. (".py", ".ts"))
+        limit: Optional maximum number of paths to yield
+        prune: Directory names to skip
+
+    Yields:
+        Matching file paths relative to root
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    for dirpath, dirnames, filenames in os.walk(root, topdown=True, followlinks=False):
+        # Prune in place so os.walk never descends into these directories
+        dirnames[:] = [
+            d for d in dirnames if not d.startswith(".") and d not in prune
+        ]
+        rel_dir = os.path.relpath(dirpath, root)
+        for filename in filenames:
+            if filename.endswith(extensions):
+                yield filename if rel_dir == "." else os.path.join(rel_dir, filename)
+                count += 1
+                if count == limit:
+                    return
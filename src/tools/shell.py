@@ -1,9 +1,12 @@
 """Shell command execution tool."""
 
 import re
+import shlex
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import IO, Any
 
 
 @dataclass
@@ -51,9 +54,32 @@ DANGEROUS_PATTERNS: list[tuple[str, str]] = [
     (r"\:(fork\s*bomb|:\(\)\{)", "fork bomb"),
 ]
 
+# All dangerous patterns as one alternation, so a command is scanned once;
+# group pN corresponds to DANGEROUS_PATTERNS[N]
+_DANGEROUS_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(DANGEROUS_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Description of the dangerous pattern for each group number in _DANGEROUS_RE
+_DANGEROUS_GROUPS: dict[int, str] = {
+    _DANGEROUS_RE.groupindex[f"p{i}"]: description
+    for i, (_, description) in enumerate(DANGEROUS_PATTERNS)
+}
+
+# Characters that need the shell: operators, redirection, substitution,
+# globbing, comments, home directory expansion and backslash escapes
+_SHELL_META = re.compile(r"[|&;<>()$`*?\[\]{}#~\n\\]")
+
 # Maximum output size before truncation (100KB)
 MAX_OUTPUT_SIZE = 100 * 1024
 
+# Size of each read from a command's output pipes
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Appended to output that was cut at MAX_OUTPUT_SIZE
+_TRUNCATION_MARKER = "\n\n[output truncated]"
+
 
 def _check_dangerous_command(command: str) -> None:
     """Check if a command matches dangerous patterns.
@@ -64,13 +90,13 @@ def _check_dangerous_command(command: str) -> None:
     Raises:
         DangerousCommandError: If the command is dangerous
     """
-    command_lower = command.lower()
-
-    for pattern, description in DANGEROUS_PATTERNS:
-        if re.search(pattern, command_lower):
-            raise DangerousCommandError(
-                f"Blocked dangerous command: {description}"
-            )
+    match = _DANGEROUS_RE.search(command)
+    # Each pattern's group encloses any groups of its own, so it is the last
+    # group to close and lastindex identifies it
+    if match and match.lastindex is not None:
+        raise DangerousCommandError(
+            f"Blocked dangerous command: {_DANGEROUS_GROUPS[match.lastindex]}"
+        )
 
 
 def _truncate_output(output: str, max_size: int = MAX_OUTPUT_SIZE) -> tuple[str, bool]:
@@ -83,15 +109,86 @@ def _truncate_output(output: str, max_size: int = MAX_OUTPUT_SIZE) -> tuple[str,
     Returns:
         Tuple of (possibly truncated output, was_truncated)
     """
-    if len(output.encode("utf-8")) <= max_size:
+    # UTF-8 uses at most 4 bytes per character, so short output always fits
+    # and need not be encoded
+    if len(output) * 4 <= max_size:
         return output, False
 
-    # Truncate to max_size bytes
-    encoded = output.encode("utf-8")[:max_size]
-    # Decode safely, ignoring incomplete characters at the end
-    truncated = encoded.decode("utf-8", errors="ignore")
+    encoded = output.encode("utf-8")
+    if len(encoded) <= max_size:
+        return output, False
+
+    # Truncate to max_size bytes, decoding safely and ignoring incomplete
+    # characters at the end
+    truncated = encoded[:max_size].decode("utf-8", errors="ignore")
+
+    return truncated + _TRUNCATION_MARKER, True
+
+
+def _exec_args(command: str) -> list[str] | None:
+    """Split a command for direct execution if it needs no shell features.
+
+    Args:
+        command: Command to split
+
+    Returns:
+        Argument list, or None if the command must run through the shell
+    """
+    if _SHELL_META.search(command):
+        return None
+    try:
+        return shlex.split(command) or None
+    except ValueError:
+        # Unbalanced quotes; let the shell report the error
+        return None
+
 
-    return truncated + "\n\n[output truncated]", True
+def _drain(stream: IO[bytes], buf: bytearray, limit: int) -> None:
+    """Read a pipe to EOF, keeping at most ``limit + 1`` bytes.
+
+    Bytes past the limit are read and discarded, so the command never
+    blocks on a full pipe while memory stays bounded however much it
+    writes.
+
+    Args:
+        stream: Pipe to read
+        buf: Buffer that receives the kept bytes
+        limit: Number of bytes to keep; one extra byte marks truncation
+    """
+    with stream:
+        while chunk := stream.read(_READ_CHUNK_SIZE):
+            room = limit + 1 - len(buf)
+            if room > 0:
+                buf += chunk[:room]
+
+
+def _decode_output(data: bytes | bytearray, max_size: int = MAX_OUTPUT_SIZE) -> tuple[str, bool]:
+    """Decode captured output, truncating it if it exceeds max size.
+
+    Newlines are translated as in text mode, and invalid UTF-8 is
+    replaced rather than failing the command.
+
+    Args:
+        data: Captured bytes, at most ``max_size + 1`` of them
+        max_size: Maximum size in bytes
+
+    Returns:
+        Tuple of (possibly truncated output, was_truncated)
+    """
+    if len(data) > max_size:
+        # The pipe was cut short; drop any incomplete character at the cut
+        text = bytes(data[:max_size]).decode("utf-8", errors="ignore")
+        truncated = True
+    else:
+        text = data.decode("utf-8", errors="replace")
+        truncated = False
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    if truncated:
+        return text + _TRUNCATION_MARKER, True
+    return _truncate_output(text, max_size)
 
 
 def run_command(
@@ -122,26 +219,59 @@ def run_command(
         )
 
     try:
-        # Run the command
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=cwd,
-            env=env,
-        )
-
-        # Truncate outputs if necessary
-        stdout, stdout_truncated = _truncate_output(result.stdout)
-        stderr, stderr_truncated = _truncate_output(result.stderr)
+        # Run the command, reading its output as it is produced so that
+        # at most MAX_OUTPUT_SIZE bytes per stream are held in memory
+        deadline = time.monotonic() + timeout
+        popen_options: dict[str, Any] = {
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.PIPE,
+            "cwd": cwd,
+            "env": env,
+        }
+
+        # Simple commands are executed directly, saving a shell process
+        proc: subprocess.Popen[bytes] | None = None
+        args = _exec_args(command)
+        if args:
+            try:
+                proc = subprocess.Popen(args, **popen_options)
+            except OSError:
+                # Not a runnable program (e.g. a shell builtin such as cd,
+                # or a variable assignment); the shell runs it or reports
+                # the error as it always has
+                proc = None
+        if proc is None:
+            proc = subprocess.Popen(command, shell=True, **popen_options)
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        readers = [
+            threading.Thread(target=_drain, args=(stream, buf, MAX_OUTPUT_SIZE), daemon=True)
+            for stream, buf in ((proc.stdout, stdout_buf), (proc.stderr, stderr_buf))
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = proc.wait(timeout=timeout)
+            # Background children may hold the pipes open past the shell
+            for reader in readers:
+                reader.join(max(0.0, deadline - time.monotonic()))
+                if reader.is_alive():
+                    raise subprocess.TimeoutExpired(command, timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+
+        # Decode and truncate outputs if necessary
+        stdout, stdout_truncated = _decode_output(stdout_buf)
+        stderr, stderr_truncated = _decode_output(stderr_buf)
 
         return ShellResult(
-            success=result.returncode == 0,
+            success=returncode == 0,
             stdout=stdout,
             stderr=stderr,
-            exit_code=result.returncode,
+            exit_code=returncode,
             metadata={
                 "command": command,
                 "cwd": cwd,